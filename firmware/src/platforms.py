@@ -1,19 +1,21 @@
 # platforms.py -- build settings for each "standard" firmware build.
 #
 #   Individuals can extend the list of known platforms by supplying
-#   the file ~/.sailfish_platforms.py containing additional entries
-#   for the platforms{} dictionary.  In the following example, an
-#   entry is defined for a platform named "franken-board"
-#
-#     % cat ~/.sailfish_platforms.py
-#     platforms['franken-board'] = {
-#         'mcu' : 'atmega2560',
-#         'programmer' : 'stk500v2',
-#         'board_directory' : 'mighty_one',
-#         'defines' : [ 'CORE_XY', 'BUILD_STATS', 'ALTERNATE_UART',
-#                       'HEATERS_ON_STEROIDS', 'MAX31855',
-#                       '__DELAY_BACKWARD_COMPATIBLE__',
-#                       '__PROG_TYPES_COMPAT__' ]
+#   the file ~/.sailfish_platforms.json containing a dictionary of
+#   additional platforms.  In the following example, an entry is
+#   defined for a platform named "franken-board"
+#
+#     % cat ~/.sailfish_platforms.json
+#     {
+#         "franken-board" : {
+#             "mcu" : "atmega2560",
+#             "programmer" : "stk500v2",
+#             "board_directory" : "mighty_one",
+#             "defines" : [ "CORE_XY", "BUILD_STATS", "ALTERNATE_UART",
+#                           "HEATERS_ON_STEROIDS", "MAX31855",
+#                           "__DELAY_BACKWARD_COMPATIBLE__",
+#                           "__PROG_TYPES_COMPAT__" ]
+#         }
 #     }
 #
 #  It can then be built with the simple command
@@ -26,15 +28,37 @@
 #
 #  It misses setting -DBUILD_STATS since there is no command line option
 #  to select that.
-
-from os.path import expanduser, isfile
-
-platforms = {
-
-# This is a dictionary of platform names to build.
-# Each platform to build is itself a dictionary containing build settings.
-# The settings are
 #
+#  The older ~/.sailfish_platforms.py, which adds entries to the
+#  platforms{} dictionary with Python statements such as
+#
+#    platforms['franken-board'] = { 'mcu' : 'atmega2560', ... }
+#
+#  is still read.  When both files exist, the platforms of both are
+#  known; a platform defined in both is taken from the JSON file.
+#
+#  Importing this module does no file I/O.  platforms.json and the user
+#  files are only read on the first call to one of the get_* functions
+#  below.
+#
+#  The standard platforms themselves live in platforms.json, next to this
+#  file.  The merged dictionary (including any user supplied entries) is
+#  cached in ~/.sailfish_platforms.cache-pyXY, XY being the Python version,
+#  separately for each checkout, and only rebuilt when this file,
+#  platforms.json or one of the user files changes.
+#
+# The "platforms" section of platforms.json is a dictionary of platform
+# names to build.  Each platform to build is itself a dictionary containing
+# build settings.  The settings are
+#
+#   base       -- Name of an entry in the "templates" section of
+#                 platforms.json, or a list of such names.  The platform
+#                 starts from the templates' settings, taken in order; its
+#                 own defines are appended to the templates' and any other
+#                 setting replaces the templates'.  Besides one template
+#                 per board and processor, there are templates for each
+#                 printer family (splash strings, geometry, ...) and for
+#                 groups of defines used together, such as auto_level.
 #   mcu        -- Processor name (e.g., atmega1280)
 #   programmer -- avrdude programmer type (e.g., stk500v1)
 #   board_directory -- Name of the motherboard specific board directory to
@@ -42,6 +66,9 @@ platforms = {
 #                      (e.g., mighty_one)
 #   defines    -- List of #defines to establish.  Any string prefixed with '-'
 #                 will be removed from the list of #defines to establish.
+#                 get_platform() hands the list back as a tuple; use
+#                 defines_set() rather than 'in' on the tuple for
+#                 membership tests.
 #
 #      PLATFORM_AXIS_INVERT          -- bitmask for axis inversion (0b---BAZYX)
 #                                       (default: 0b00010111)
@@ -124,775 +151,388 @@ platforms = {
 #                                       the platform too, if uncertain or if you haven't modified the
 #                                       printer DON'T USE THIS ONE.
 #
+#   axis_lengths      -- PLATFORM_AXIS_LENGTHS as a list of numbers
+#   axis_steps_per_mm -- PLATFORM_AXIS_STEPS_PER_MM as a list of numbers
+#   max_feedrates     -- PLATFORM_MAX_FEEDRATES as a list of numbers
+#   vref_defaults     -- PLATFORM_VREF_DEFAULTS as a list of numbers
+#
+#                 Each is turned into the corresponding C initializer
+#                 define (e.g., PLATFORM_AXIS_LENGTHS={227L, 148L, ...})
+#                 placed after the defines of the platform's base and
+#                 before its own, so the latter can override or remove it.
+#
 #   squeeze    -- Source files to compile --mcall-prologues so as to save
 #                 code space.
 
-    'mighty_one-hyper-zmax' :
-        { 'mcu' : 'atmega1280',
-          'programmer' : 'stk500v1',
-          'board_directory' : 'mighty_one',
-          
-          'defines' : [ 'BUILD_STATS', 'AUTO_LEVEL', 'USE_ZMAX_HOME',
-                        'PSTOP_ZMIN_LEVEL', 'AUTO_LEVEL_IGNORE_ZMIN_ONBUILD',
-                        'HAS_RGB_LED', 'EEPROM_MENU_ENABLE', 'COOLING_FAN_PWM',
-                        'PLATFORM_SPLASH1_MSG=\\\"SF-Replicator1\\\"',
-                        'PLATFORM_THE_REPLICATOR_STR=\\\"Replicator 1\\\"']
-          },
-
-    'mighty_one-hyper' :
-        { 'mcu' : 'atmega1280',
-          'programmer' : 'stk500v1',
-          'board_directory' : 'mighty_one',
-          
-          'defines' : [ 'BUILD_STATS', 'AUTO_LEVEL',
-                        'PSTOP_ZMIN_LEVEL', 'AUTO_LEVEL_IGNORE_ZMIN_ONBUILD',
-                        'HAS_RGB_LED', 'EEPROM_MENU_ENABLE', 'COOLING_FAN_PWM',
-                        'PLATFORM_SPLASH1_MSG=\\\"SF-Replicator1\\\"',
-                        'PLATFORM_THE_REPLICATOR_STR=\\\"Replicator 1\\\"']
-          },
-
-    'mighty_one' :
-        { 'mcu' : 'atmega1280',
-          'programmer' : 'stk500v1',
-          'board_directory' : 'mighty_one',
-          'defines' : [ 'HAS_RGB_LED', 'EEPROM_MENU_ENABLE', 'COOLING_FAN_PWM',
-                        'PLATFORM_SPLASH1_MSG=\\\"SF-Replicator1\\\"',
-                        'PLATFORM_THE_REPLICATOR_STR=\\\"Replicator 1\\\"']
-          },
-
-    'mighty_one-architect-hyper-zmax' :
-        { 'mcu' : 'atmega1280',
-          'programmer' : 'stk500v1',
-          'board_directory' : 'mighty_one',
-          'defines' : [ 'AUTO_LEVEL', 'PSTOP_ZMIN_LEVEL', 'AUTO_LEVEL_IGNORE_ZMIN_ONBUILD',
-                        'SINGLE_EXTRUDER', 'BUILD_STATS', 'EEPROM_MENU_ENABLE',
-                        'PLATFORM_HBP_PRESENT=0',  'COOLING_FAN_PWM',
-                        'PLATFORM_EXTRUDERS=1', 'USE_ZMAX_HOME',
-                        'PLATFORM_SPLASH1_MSG=\\\"SF-Architect\\\"',
-                        'PLATFORM_THE_REPLICATOR_STR=\\\"Architect\\\"']
-          },		  
-		  
-    'mighty_one-architect-hyper' :
-        { 'mcu' : 'atmega1280',
-          'programmer' : 'stk500v1',
-          'board_directory' : 'mighty_one',
-          'defines' : [ 'AUTO_LEVEL', 'PSTOP_ZMIN_LEVEL', 'AUTO_LEVEL_IGNORE_ZMIN_ONBUILD',
-                        'SINGLE_EXTRUDER', 'BUILD_STATS', 'EEPROM_MENU_ENABLE',
-                        'PLATFORM_HBP_PRESENT=0',  'COOLING_FAN_PWM',
-                        'PLATFORM_EXTRUDERS=1',
-                        'PLATFORM_SPLASH1_MSG=\\\"SF-Architect\\\"',
-                        'PLATFORM_THE_REPLICATOR_STR=\\\"Architect\\\"']
-          },
-
-    'mighty_one-architect' :
-        { 'mcu' : 'atmega1280',
-          'programmer' : 'stk500v1',
-          'board_directory' : 'mighty_one',
-          'defines' : [ 'SINGLE_EXTRUDER', 'BUILD_STATS', 'EEPROM_MENU_ENABLE',
-                        'PLATFORM_HBP_PRESENT=0',  'COOLING_FAN_PWM',
-                        'PLATFORM_EXTRUDERS=1',
-                        'PLATFORM_SPLASH1_MSG=\\\"SF-Architect\\\"',
-                        'PLATFORM_THE_REPLICATOR_STR=\\\"Architect\\\"']
-          },
-
-    'mighty_one-corexy-hyper-zmax' :
-        { 'mcu' : 'atmega1280',
-          'programmer' : 'stk500v1',
-          'board_directory' : 'mighty_one',
-          'defines' : [ 'AUTO_LEVEL', 'PSTOP_ZMIN_LEVEL', 'AUTO_LEVEL_IGNORE_ZMIN_ONBUILD',
-                        'CORE_XY', 'HEATERS_ON_STEROIDS', 'BUILD_STATS', 'USE_ZMAX_HOME',
-                        'COOLING_FAN_PWM', 'HAS_RGB_LED', 'EEPROM_MENU_ENABLE',
-                        'PLATFORM_SPLASH1_MSG=\\\"SF-Rep1 CoreXY\\\"',
-                        'PLATFORM_THE_REPLICATOR_STR=\\\"Rep1 CoreXY\\\"']
-        },		  
-		  
-    'mighty_one-corexy-hyper' :
-        { 'mcu' : 'atmega1280',
-          'programmer' : 'stk500v1',
-          'board_directory' : 'mighty_one',
-          'defines' : [ 'AUTO_LEVEL', 'PSTOP_ZMIN_LEVEL', 'AUTO_LEVEL_IGNORE_ZMIN_ONBUILD',
-                        'CORE_XY', 'HEATERS_ON_STEROIDS', 'BUILD_STATS',
-                        'COOLING_FAN_PWM', 'HAS_RGB_LED', 'EEPROM_MENU_ENABLE',
-                        'PLATFORM_SPLASH1_MSG=\\\"SF-Rep1 CoreXY\\\"',
-                        'PLATFORM_THE_REPLICATOR_STR=\\\"Rep1 CoreXY\\\"']
-        },
-
-    'mighty_one-corexy' :
-        { 'mcu' : 'atmega1280',
-          'programmer' : 'stk500v1',
-          'board_directory' : 'mighty_one',
-          'defines' : [ 'CORE_XY', 'HEATERS_ON_STEROIDS', 'BUILD_STATS',
-                        'COOLING_FAN_PWM', 'HAS_RGB_LED', 'EEPROM_MENU_ENABLE',
-                        'PLATFORM_SPLASH1_MSG=\\\"SF-Rep1 CoreXY\\\"',
-                        'PLATFORM_THE_REPLICATOR_STR=\\\"Rep1 CoreXY\\\"']
-        },
-
-    'mighty_one-2560-zmax' :
-        { 'mcu' : 'atmega2560',
-          'programmer' : 'stk500v2',
-          'board_directory' : 'mighty_one',
-          'defines' : [ 'BUILD_STATS', 'ALTERNATE_UART', 'AUTO_LEVEL', 'AUTO_LEVEL_IGNORE_ZMIN_ONBUILD',
-                        'PSTOP_ZMIN_LEVEL', 'HAS_RGB_LED', 'COOLING_FAN_PWM', 'USE_ZMAX_HOME',
-                        'PLATFORM_SPLASH1_MSG=\\\"SF-Replicator1\\\"',
-                        'PLATFORM_THE_REPLICATOR_STR=\\\"Replicator 1\\\"',
-                        'EEPROM_MENU_ENABLE', 'RGB_LED_MENU' ]
-        },
-		
-    'mighty_one-2560' :
-        { 'mcu' : 'atmega2560',
-          'programmer' : 'stk500v2',
-          'board_directory' : 'mighty_one',
-          'defines' : [ 'BUILD_STATS', 'ALTERNATE_UART', 'AUTO_LEVEL', 'AUTO_LEVEL_IGNORE_ZMIN_ONBUILD',
-                        'PSTOP_ZMIN_LEVEL', 'HAS_RGB_LED', 'COOLING_FAN_PWM',
-                        'PLATFORM_SPLASH1_MSG=\\\"SF-Replicator1\\\"',
-                        'PLATFORM_THE_REPLICATOR_STR=\\\"Replicator 1\\\"',
-                        'EEPROM_MENU_ENABLE', 'RGB_LED_MENU' ]
-        },
-
-    'CTC_BizerMod-2560-zmax' :
-        { 'mcu' : 'atmega2560',
-          'programmer' : 'stk500v2',
-          'board_directory' : 'mighty_one',
-          'defines' : [ 'BUILD_STATS', 'ALTERNATE_UART', 'AUTO_LEVEL', 'USE_ZMAX_HOME',
-                        'PSTOP_ZMIN_LEVEL', 'AUTO_LEVEL_IGNORE_ZMIN_ONBUILD', 'COOLING_FAN_PWM',
-                        'PLATFORM_SPLASH1_MSG=\\\"SF-CTC Bizer\\\"',
-                        'PLATFORM_THE_REPLICATOR_STR=\\\"CTC Bizer v2\\\"',
-                        'EEPROM_MENU_ENABLE' ]
-        },
-		
-    'CTC_BizerMod-2560' :
-        { 'mcu' : 'atmega2560',
-          'programmer' : 'stk500v2',
-          'board_directory' : 'mighty_one',
-          'defines' : [ 'BUILD_STATS', 'ALTERNATE_UART', 'AUTO_LEVEL',
-                        'PSTOP_ZMIN_LEVEL', 'AUTO_LEVEL_IGNORE_ZMIN_ONBUILD', 'COOLING_FAN_PWM',
-                        'PLATFORM_SPLASH1_MSG=\\\"SF-CTC Bizer\\\"',
-                        'PLATFORM_THE_REPLICATOR_STR=\\\"CTC Bizer v2\\\"',
-                        'EEPROM_MENU_ENABLE' ]
-        },
-
-    'CTC_BondtechDualDrive-2560' :
-        { 'mcu' : 'atmega2560',
-          'programmer' : 'stk500v2',
-          'board_directory' : 'mighty_one',
-          'defines' : [ 'BUILD_STATS', 'ALTERNATE_UART', 'AUTO_LEVEL',
-                        'PSTOP_ZMIN_LEVEL', 'AUTO_LEVEL_IGNORE_ZMIN_ONBUILD', 'COOLING_FAN_PWM',
-                        'PLATFORM_SPLASH1_MSG=\\\"SF-CTC Bizer \\\"', 'USE_ZMAX_HOME',
-                        'PLATFORM_THE_REPLICATOR_STR=\\\"CTC Bizer v2\\\"',
-                        'PLATFORM_TOOLHEAD_OFFSET_X=3624',
-                        'PLATFORM_AXIS_STEPS_PER_MM={94139704, 94139704, 400000000, 147773066, 147773066}',
-                        'EEPROM_MENU_ENABLE' ]
-        },
-
-    'mighty_one-2560-corexy-zmax' :
-        { 'mcu' : 'atmega2560',
-          'programmer' : 'stk500v2',
-          'board_directory' : 'mighty_one',
-          'defines' : [ 'CORE_XY', 'BUILD_STATS', 'ALTERNATE_UART', 'AUTO_LEVEL_IGNORE_ZMIN_ONBUILD',
-                        'HEATERS_ON_STEROIDS', 'AUTO_LEVEL', 'HAS_RGB_LED',
-                        'PSTOP_ZMIN_LEVEL', 'COOLING_FAN_PWM', 'USE_ZMAX_HOME',
-                        'PLATFORM_SPLASH1_MSG=\\\"SF-Rep1 CoreXY\\\"',
-                        'PLATFORM_THE_REPLICATOR_STR=\\\"Rep1 CoreXY\\\"',
-                        'EEPROM_MENU_ENABLE', 'RGB_LED_MENU' ]
-        },
-		
-    'mighty_one-2560-corexy' :
-        { 'mcu' : 'atmega2560',
-          'programmer' : 'stk500v2',
-          'board_directory' : 'mighty_one',
-          'defines' : [ 'CORE_XY', 'BUILD_STATS', 'ALTERNATE_UART', 'AUTO_LEVEL_IGNORE_ZMIN_ONBUILD',
-                        'HEATERS_ON_STEROIDS', 'AUTO_LEVEL', 'HAS_RGB_LED',
-                        'PSTOP_ZMIN_LEVEL', 'COOLING_FAN_PWM',
-                        'PLATFORM_SPLASH1_MSG=\\\"SF-Rep1 CoreXY\\\"',
-                        'PLATFORM_THE_REPLICATOR_STR=\\\"Rep1 CoreXY\\\"',
-                        'EEPROM_MENU_ENABLE', 'RGB_LED_MENU' ]
-        },
-
-    'mighty_one-2560-clone-r1-zmax' :
-        { 'mcu' : 'atmega2560',
-          'programmer' : 'stk500v2',
-          'board_directory' : 'mighty_one',
-          'defines' : [ 'CORE_XY', 'BUILD_STATS', 'ALTERNATE_UART', 'AUTO_LEVEL_IGNORE_ZMIN_ONBUILD',
-                        'HEATERS_ON_STEROIDS', 'AUTO_LEVEL', 'HAS_RGB_LED',
-                        'PSTOP_ZMIN_LEVEL', 'COOLING_FAN_PWM', 'USE_ZMAX_HOME',
-                        'PLATFORM_SPLASH1_MSG=\\\"SF-Clone R1 \\\"',
-                        'PLATFORM_THE_REPLICATOR_STR=\\\"CloneR1\\\"',
-                        'PLATFORM_X_OFFSET_STEPS=14444L',
-                        'PLATFORM_Y_OFFSET_STEPS=8667L',
-                        'PLATFORM_AXIS_LENGTHS={300L, 195L, 210L, 100000L, 100000L}',
-                        'PLATFORM_AXIS_STEPS_PER_MM={88888889, 88888889, 400000000, 96275202, 96275202}',
-                        'EEPROM_MENU_ENABLE', 'CLONE_R1', 'RGB_LED_MENU' ]
-        },
-		
-    'mighty_one-2560-clone-r1' :
-        { 'mcu' : 'atmega2560',
-          'programmer' : 'stk500v2',
-          'board_directory' : 'mighty_one',
-          'defines' : [ 'CORE_XY', 'BUILD_STATS', 'ALTERNATE_UART', 'AUTO_LEVEL_IGNORE_ZMIN_ONBUILD',
-                        'HEATERS_ON_STEROIDS', 'AUTO_LEVEL', 'HAS_RGB_LED',
-                        'PSTOP_ZMIN_LEVEL', 'COOLING_FAN_PWM',
-                        'PLATFORM_SPLASH1_MSG=\\\"SF-Clone R1 \\\"',
-                        'PLATFORM_THE_REPLICATOR_STR=\\\"CloneR1\\\"',
-                        'PLATFORM_X_OFFSET_STEPS=14444L',
-                        'PLATFORM_Y_OFFSET_STEPS=8667L',
-                        'PLATFORM_AXIS_LENGTHS={300L, 195L, 210L, 100000L, 100000L}',
-                        'PLATFORM_AXIS_STEPS_PER_MM={88888889, 88888889, 400000000, 96275202, 96275202}',
-                        'EEPROM_MENU_ENABLE', 'CLONE_R1', 'RGB_LED_MENU' ]
-        },
-
-    'mighty_one-2560-max31855-corexy-zmax' :
-        { 'mcu' : 'atmega2560',
-          'programmer' : 'stk500v2',
-          'board_directory' : 'mighty_one',
-          'defines' : [ 'CORE_XY', 'BUILD_STATS', 'ALTERNATE_UART', 'USE_ZMAX_HOME',
-                        'HAS_RGB_LED', 'HEATERS_ON_STEROIDS', 'AUTO_LEVEL',
-                        'MAX31855', 'PSTOP_ZMIN_LEVEL', 'COOLING_FAN_PWM',
-                        'PLATFORM_SPLASH1_MSG=\\\"SF-Rep1 CoreXY\\\"',
-                        'PLATFORM_THE_REPLICATOR_STR=\\\"Rep1 CoreXY\\\"',
-                        'EEPROM_MENU_ENABLE', 'RGB_LED_MENU', 'AUTO_LEVEL_IGNORE_ZMIN_ONBUILD' ]
-        },
-		
-    'mighty_one-2560-max31855-corexy' :
-        { 'mcu' : 'atmega2560',
-          'programmer' : 'stk500v2',
-          'board_directory' : 'mighty_one',
-          'defines' : [ 'CORE_XY', 'BUILD_STATS', 'ALTERNATE_UART',
-                        'HAS_RGB_LED', 'HEATERS_ON_STEROIDS', 'AUTO_LEVEL',
-                        'MAX31855', 'PSTOP_ZMIN_LEVEL', 'COOLING_FAN_PWM',
-                        'PLATFORM_SPLASH1_MSG=\\\"SF-Rep1 CoreXY\\\"',
-                        'PLATFORM_THE_REPLICATOR_STR=\\\"Rep1 CoreXY\\\"',
-                        'EEPROM_MENU_ENABLE', 'RGB_LED_MENU', 'AUTO_LEVEL_IGNORE_ZMIN_ONBUILD' ]
-        },
-
-    'mighty_one-2560-max31855-zmax' :
-        { 'mcu' : 'atmega2560',
-          'programmer' : 'stk500v2',
-          'board_directory' : 'mighty_one',
-          'defines' : [ 'BUILD_STATS', 'ALTERNATE_UART', 'MAX31855', 'USE_ZMAX_HOME',
-                        'COOLING_FAN_PWM', 'AUTO_LEVEL', 'PSTOP_ZMIN_LEVEL',
-                        'HAS_RGB_LED', 'AUTO_LEVEL_IGNORE_ZMIN_ONBUILD',
-                        'PLATFORM_SPLASH1_MSG=\\\"SF-Replicator1\\\"',
-                        'PLATFORM_THE_REPLICATOR_STR=\\\"Replicator 1\\\"',
-                        'EEPROM_MENU_ENABLE', 'RGB_LED_MENU' ]
-        },
-		
-    'mighty_one-2560-max31855' :
-        { 'mcu' : 'atmega2560',
-          'programmer' : 'stk500v2',
-          'board_directory' : 'mighty_one',
-          'defines' : [ 'BUILD_STATS', 'ALTERNATE_UART', 'MAX31855',
-                        'COOLING_FAN_PWM', 'AUTO_LEVEL', 'PSTOP_ZMIN_LEVEL',
-                        'HAS_RGB_LED', 'AUTO_LEVEL_IGNORE_ZMIN_ONBUILD',
-                        'PLATFORM_SPLASH1_MSG=\\\"SF-Replicator1\\\"',
-                        'PLATFORM_THE_REPLICATOR_STR=\\\"Replicator 1\\\"',
-                        'EEPROM_MENU_ENABLE', 'RGB_LED_MENU' ]
-        },
-
-    'mighty_two-hyper-zmax' :
-        { 'mcu' : 'atmega1280',
-          'programmer' : 'stk500v1',
-          'board_directory' : 'mighty_two',
-          'defines' : [ 'AUTO_LEVEL', 'PSTOP_ZMIN_LEVEL', 'AUTO_LEVEL_IGNORE_ZMIN_ONBUILD',
-                        'SINGLE_EXTRUDER', 'BUILD_STATS', 'HAS_RGB_LED',
-                        'COOLING_FAN_PWM', 'USE_ZMAX_HOME',
-                        'PLATFORM_SPLASH1_MSG=\\\"SF-Replicator2\\\"',
-                        'PLATFORM_TOOLHEAD_OFFSET_X=3100',
-                        'PLATFORM_THE_REPLICATOR_STR=\\\"Replicator 2\\\"',
-                        'PLATFORM_MACHINE_ID=0xB015',
-                        'PLATFORM_X_OFFSET_STEPS=13463L',
-                        'PLATFORM_Y_OFFSET_STEPS=6643L',
-                        'PLATFORM_HBP_PRESENT=0',
-                        'PLATFORM_AXIS_LENGTHS={285L, 152L, 155L, 100000L, 100000L}',
-                        'PLATFORM_AXIS_STEPS_PER_MM={88573186, 88573186, 400000000, 96275202, 96275202}',
-                        'EEPROM_MENU_ENABLE' ],
-        },
-		
-    'mighty_two-hyper' :
-        { 'mcu' : 'atmega1280',
-          'programmer' : 'stk500v1',
-          'board_directory' : 'mighty_two',
-          'defines' : [ 'AUTO_LEVEL', 'PSTOP_ZMIN_LEVEL', 'AUTO_LEVEL_IGNORE_ZMIN_ONBUILD',
-                        'SINGLE_EXTRUDER', 'BUILD_STATS', 'HAS_RGB_LED',
-                        'COOLING_FAN_PWM',
-                        'PLATFORM_SPLASH1_MSG=\\\"SF-Replicator2\\\"',
-                        'PLATFORM_TOOLHEAD_OFFSET_X=3100',
-                        'PLATFORM_THE_REPLICATOR_STR=\\\"Replicator 2\\\"',
-                        'PLATFORM_MACHINE_ID=0xB015',
-                        'PLATFORM_X_OFFSET_STEPS=13463L',
-                        'PLATFORM_Y_OFFSET_STEPS=6643L',
-                        'PLATFORM_HBP_PRESENT=0',
-                        'PLATFORM_AXIS_LENGTHS={285L, 152L, 155L, 100000L, 100000L}',
-                        'PLATFORM_AXIS_STEPS_PER_MM={88573186, 88573186, 400000000, 96275202, 96275202}',
-                        'EEPROM_MENU_ENABLE' ],
-        },
-
-    'mighty_two-corexy-hyper-zmax' :
-        { 'mcu' : 'atmega1280',
-          'programmer' : 'stk500v1',
-          'board_directory' : 'mighty_two',
-          'defines' : [ 'AUTO_LEVEL', 'PSTOP_ZMIN_LEVEL', 'AUTO_LEVEL_IGNORE_ZMIN_ONBUILD',
-                        'CORE_XY', 'SINGLE_EXTRUDER', 'BUILD_STATS',
-                        'HAS_RGB_LED', 'COOLING_FAN_PWM', 'USE_ZMAX_HOME',
-                        'PLATFORM_SPLASH1_MSG=\\\"SF-Rep2 CoreXY\\\"',
-                        'PLATFORM_TOOLHEAD_OFFSET_X=3100',
-                        'PLATFORM_THE_REPLICATOR_STR=\\\"Rep2 CoreXY\\\"',
-                        'PLATFORM_MACHINE_ID=0xB015',
-                        'PLATFORM_X_OFFSET_STEPS=13463L',
-                        'PLATFORM_Y_OFFSET_STEPS=6643L',
-                        'PLATFORM_AXIS_LENGTHS={285L, 152L, 155L, 100000L, 100000L}',
-                        'PLATFORM_AXIS_STEPS_PER_MM={88573186, 88573186, 400000000, 96275202, 96275202}',
-                        'EEPROM_MENU_ENABLE' ],
-        },
-		
-    'mighty_two-corexy-hyper' :
-        { 'mcu' : 'atmega1280',
-          'programmer' : 'stk500v1',
-          'board_directory' : 'mighty_two',
-          'defines' : [ 'AUTO_LEVEL', 'PSTOP_ZMIN_LEVEL', 'AUTO_LEVEL_IGNORE_ZMIN_ONBUILD',
-                        'CORE_XY', 'SINGLE_EXTRUDER', 'BUILD_STATS',
-                        'HAS_RGB_LED', 'COOLING_FAN_PWM',
-                        'PLATFORM_SPLASH1_MSG=\\\"SF-Rep2 CoreXY\\\"',
-                        'PLATFORM_TOOLHEAD_OFFSET_X=3100',
-                        'PLATFORM_THE_REPLICATOR_STR=\\\"Rep2 CoreXY\\\"',
-                        'PLATFORM_MACHINE_ID=0xB015',
-                        'PLATFORM_X_OFFSET_STEPS=13463L',
-                        'PLATFORM_Y_OFFSET_STEPS=6643L',
-                        'PLATFORM_AXIS_LENGTHS={285L, 152L, 155L, 100000L, 100000L}',
-                        'PLATFORM_AXIS_STEPS_PER_MM={88573186, 88573186, 400000000, 96275202, 96275202}',
-                        'EEPROM_MENU_ENABLE' ],
-        },
-
-    'mighty_two' :
-        { 'mcu' : 'atmega1280',
-          'programmer' : 'stk500v1',
-          'board_directory' : 'mighty_two',
-          'defines' : [ 'SINGLE_EXTRUDER', 'BUILD_STATS', 'HAS_RGB_LED',
-                        'COOLING_FAN_PWM',
-                        'PLATFORM_SPLASH1_MSG=\\\"SF-Replicator2\\\"',
-                        'PLATFORM_TOOLHEAD_OFFSET_X=3100',
-                        'PLATFORM_THE_REPLICATOR_STR=\\\"Replicator 2\\\"',
-                        'PLATFORM_MACHINE_ID=0xB015',
-                        'PLATFORM_X_OFFSET_STEPS=13463L',
-                        'PLATFORM_Y_OFFSET_STEPS=6643L',
-                        'PLATFORM_HBP_PRESENT=0',
-                        'PLATFORM_AXIS_LENGTHS={285L, 152L, 155L, 100000L, 100000L}',
-                        'PLATFORM_AXIS_STEPS_PER_MM={88573186, 88573186, 400000000, 96275202, 96275202}',
-                        'EEPROM_MENU_ENABLE' ]
-        },
-
-    'mighty_two-corexy' :
-        { 'mcu' : 'atmega1280',
-          'programmer' : 'stk500v1',
-          'board_directory' : 'mighty_two',
-          'defines' : [ 'CORE_XY', 'SINGLE_EXTRUDER', 'BUILD_STATS',
-                        'HAS_RGB_LED', 'COOLING_FAN_PWM',
-                        'PLATFORM_SPLASH1_MSG=\\\"SF-Rep2 CoreXY\\\"',
-                        'PLATFORM_TOOLHEAD_OFFSET_X=3100',
-                        'PLATFORM_THE_REPLICATOR_STR=\\\"Rep2 CoreXY\\\"',
-                        'PLATFORM_MACHINE_ID=0xB015',
-                        'PLATFORM_X_OFFSET_STEPS=13463L',
-                        'PLATFORM_Y_OFFSET_STEPS=6643L',
-                        'PLATFORM_AXIS_LENGTHS={285L, 152L, 155L, 100000L, 100000L}',
-                        'PLATFORM_AXIS_STEPS_PER_MM={88573186, 88573186, 400000000, 96275202, 96275202}',
-                        'EEPROM_MENU_ENABLE' ]
-        },
-
-    'mighty_two-2560-zmax' :
-        { 'mcu' : 'atmega2560',
-          'programmer' : 'stk500v2',
-          'board_directory' : 'mighty_two',
-          'defines' : [ 'SINGLE_EXTRUDER', 'BUILD_STATS', 'ALTERNATE_UART',
-                        'COOLING_FAN_PWM', 'USE_ZMAX_HOME',
-                        'PLATFORM_SPLASH1_MSG=\\\"SF-Replicator2\\\"',
-                        'PLATFORM_TOOLHEAD_OFFSET_X=3100',
-                        'PLATFORM_THE_REPLICATOR_STR=\\\"Replicator 2\\\"',
-                        'PLATFORM_MACHINE_ID=0xB015',
-                        'PLATFORM_X_OFFSET_STEPS=13463L',
-                        'PLATFORM_Y_OFFSET_STEPS=6643L',
-                        'PLATFORM_HBP_PRESENT=0',
-                        'PLATFORM_AXIS_LENGTHS={285L, 152L, 155L, 100000L, 100000L}',
-                        'PLATFORM_AXIS_STEPS_PER_MM={88573186, 88573186, 400000000, 96275202, 96275202}',
-                        'AUTO_LEVEL', 'AUTO_LEVEL_IGNORE_ZMIN_ONBUILD', 'PSTOP_ZMIN_LEVEL', 'HAS_RGB_LED',
-                        'EEPROM_MENU_ENABLE', 'RGB_LED_MENU' ]
-        },
-		
-    'mighty_two-2560' :
-        { 'mcu' : 'atmega2560',
-          'programmer' : 'stk500v2',
-          'board_directory' : 'mighty_two',
-          'defines' : [ 'SINGLE_EXTRUDER', 'BUILD_STATS', 'ALTERNATE_UART',
-                        'COOLING_FAN_PWM',
-                        'PLATFORM_SPLASH1_MSG=\\\"SF-Replicator2\\\"',
-                        'PLATFORM_TOOLHEAD_OFFSET_X=3100',
-                        'PLATFORM_THE_REPLICATOR_STR=\\\"Replicator 2\\\"',
-                        'PLATFORM_MACHINE_ID=0xB015',
-                        'PLATFORM_X_OFFSET_STEPS=13463L',
-                        'PLATFORM_Y_OFFSET_STEPS=6643L',
-                        'PLATFORM_HBP_PRESENT=0',
-                        'PLATFORM_AXIS_LENGTHS={285L, 152L, 155L, 100000L, 100000L}',
-                        'PLATFORM_AXIS_STEPS_PER_MM={88573186, 88573186, 400000000, 96275202, 96275202}',
-                        'AUTO_LEVEL', 'AUTO_LEVEL_IGNORE_ZMIN_ONBUILD', 'PSTOP_ZMIN_LEVEL', 'HAS_RGB_LED',
-                        'EEPROM_MENU_ENABLE', 'RGB_LED_MENU' ]
-        },
-
-    'mighty_twox-hyper-zmax' :
-        { 'mcu' : 'atmega1280',
-          'programmer' : 'stk500v1',
-          'board_directory' : 'mighty_two',
-          'defines' : [ 'AUTO_LEVEL', 'PSTOP_ZMIN_LEVEL', 'AUTO_LEVEL_IGNORE_ZMIN_ONBUILD',
-                        'BUILD_STATS', 'HAS_RGB_LED', 'COOLING_FAN_PWM', 'USE_ZMAX_HOME',
-                        'PLATFORM_SPLASH1_MSG=\\\"SF-Rep 2X\\\"',
-                        'PLATFORM_TOOLHEAD_OFFSET_X=3100',
-                        'PLATFORM_THE_REPLICATOR_STR=\\\"Replicator 2X\\\"',
-                        'PLATFORM_MACHINE_ID=0xB017',
-                        'PLATFORM_X_OFFSET_STEPS=13463L',
-                        'PLATFORM_Y_OFFSET_STEPS=6643L',
-                        'PLATFORM_AXIS_LENGTHS={246L, 152L, 155L, 100000L, 100000L}',
-                        'PLATFORM_AXIS_STEPS_PER_MM={88573186, 88573186, 400000000, 96275202, 96275202}',
-                        'EEPROM_MENU_ENABLE' ]
-        },
-		
-    'mighty_twox-hyper' :
-        { 'mcu' : 'atmega1280',
-          'programmer' : 'stk500v1',
-          'board_directory' : 'mighty_two',
-          'defines' : [ 'AUTO_LEVEL', 'PSTOP_ZMIN_LEVEL', 'AUTO_LEVEL_IGNORE_ZMIN_ONBUILD',
-                        'BUILD_STATS', 'HAS_RGB_LED', 'COOLING_FAN_PWM',
-                        'PLATFORM_SPLASH1_MSG=\\\"SF-Rep 2X\\\"',
-                        'PLATFORM_TOOLHEAD_OFFSET_X=3100',
-                        'PLATFORM_THE_REPLICATOR_STR=\\\"Replicator 2X\\\"',
-                        'PLATFORM_MACHINE_ID=0xB017',
-                        'PLATFORM_X_OFFSET_STEPS=13463L',
-                        'PLATFORM_Y_OFFSET_STEPS=6643L',
-                        'PLATFORM_AXIS_LENGTHS={246L, 152L, 155L, 100000L, 100000L}',
-                        'PLATFORM_AXIS_STEPS_PER_MM={88573186, 88573186, 400000000, 96275202, 96275202}',
-                        'EEPROM_MENU_ENABLE' ]
-        },
-
-    'mighty_twox' :
-        { 'mcu' : 'atmega1280',
-          'programmer' : 'stk500v1',
-          'board_directory' : 'mighty_two',
-          'defines' : [ 'BUILD_STATS', 'HAS_RGB_LED', 'COOLING_FAN_PWM',
-                        'PLATFORM_SPLASH1_MSG=\\\"SF-Rep 2X\\\"',
-                        'PLATFORM_TOOLHEAD_OFFSET_X=3100',
-                        'PLATFORM_THE_REPLICATOR_STR=\\\"Replicator 2X\\\"',
-                        'PLATFORM_MACHINE_ID=0xB017',
-                        'PLATFORM_X_OFFSET_STEPS=13463L',
-                        'PLATFORM_Y_OFFSET_STEPS=6643L',
-                        'PLATFORM_AXIS_LENGTHS={246L, 152L, 155L, 100000L, 100000L}',
-                        'PLATFORM_AXIS_STEPS_PER_MM={88573186, 88573186, 400000000, 96275202, 96275202}',
-                        'EEPROM_MENU_ENABLE' ]
-        },
-
-    'mighty_twox-2560-zmax' :
-        { 'mcu' : 'atmega2560',
-          'programmer' : 'stk500v2',
-          'board_directory' : 'mighty_two',
-          'defines' : [ 'BUILD_STATS', 'ALTERNATE_UART', 'AUTO_LEVEL','AUTO_LEVEL_IGNORE_ZMIN_ONBUILD',
-                        'PSTOP_ZMIN_LEVEL', 'HAS_RGB_LED', 'COOLING_FAN_PWM', 'USE_ZMAX_HOME',
-                        'PLATFORM_SPLASH1_MSG=\\\"SF-Rep 2X\\\"',
-                        'PLATFORM_TOOLHEAD_OFFSET_X=3100',
-                        'PLATFORM_THE_REPLICATOR_STR=\\\"Replicator 2X\\\"',
-                        'PLATFORM_MACHINE_ID=0xB017',
-                        'PLATFORM_X_OFFSET_STEPS=13463L',
-                        'PLATFORM_Y_OFFSET_STEPS=6643L',
-                        'PLATFORM_AXIS_LENGTHS={246L, 152L, 155L, 100000L, 100000L}',
-                        'PLATFORM_AXIS_STEPS_PER_MM={88573186, 88573186, 400000000, 96275202, 96275202}',
-                        'EEPROM_MENU_ENABLE', 'RGB_LED_MENU' ]
-        },
-		
-    'mighty_twox-2560' :
-        { 'mcu' : 'atmega2560',
-          'programmer' : 'stk500v2',
-          'board_directory' : 'mighty_two',
-          'defines' : [ 'BUILD_STATS', 'ALTERNATE_UART', 'AUTO_LEVEL','AUTO_LEVEL_IGNORE_ZMIN_ONBUILD',
-                        'PSTOP_ZMIN_LEVEL', 'HAS_RGB_LED', 'COOLING_FAN_PWM',
-                        'PLATFORM_SPLASH1_MSG=\\\"SF-Rep 2X\\\"',
-                        'PLATFORM_TOOLHEAD_OFFSET_X=3100',
-                        'PLATFORM_THE_REPLICATOR_STR=\\\"Replicator 2X\\\"',
-                        'PLATFORM_MACHINE_ID=0xB017',
-                        'PLATFORM_X_OFFSET_STEPS=13463L',
-                        'PLATFORM_Y_OFFSET_STEPS=6643L',
-                        'PLATFORM_AXIS_LENGTHS={246L, 152L, 155L, 100000L, 100000L}',
-                        'PLATFORM_AXIS_STEPS_PER_MM={88573186, 88573186, 400000000, 96275202, 96275202}',
-                        'EEPROM_MENU_ENABLE', 'RGB_LED_MENU' ]
-        },
-
-    'ff_creator-hyper-zmax' :
-        { 'mcu' : 'atmega1280',
-          'programmer' : 'stk500v1',
-          'board_directory' : 'mighty_one',
-          'defines' : [ 'AUTO_LEVEL', 'PSTOP_ZMIN_LEVEL', 'AUTO_LEVEL_IGNORE_ZMIN_ONBUILD',
-                        'BUILD_STATS','HEATERS_ON_STEROIDS', 'HAS_RGB_LED', 'COOLING_FAN_PWM',
-                        'PLATFORM_SPLASH1_MSG=\\\"SF-FF Creator\\\"', 'USE_ZMAX_HOME',
-                        'PLATFORM_TOOLHEAD_OFFSET_X=3201',
-                        'PLATFORM_THE_REPLICATOR_STR=\\\"FF Creator\\\"',
-                        'EEPROM_MENU_ENABLE' ]
-        },
-		
-    'ff_creator-hyper' :
-        { 'mcu' : 'atmega1280',
-          'programmer' : 'stk500v1',
-          'board_directory' : 'mighty_one',
-          'defines' : [ 'AUTO_LEVEL', 'PSTOP_ZMIN_LEVEL', 'AUTO_LEVEL_IGNORE_ZMIN_ONBUILD',
-                        'BUILD_STATS','HEATERS_ON_STEROIDS', 'HAS_RGB_LED', 'COOLING_FAN_PWM',
-                        'PLATFORM_SPLASH1_MSG=\\\"SF-FF Creator\\\"',
-                        'PLATFORM_TOOLHEAD_OFFSET_X=3201',
-                        'PLATFORM_THE_REPLICATOR_STR=\\\"FF Creator\\\"',
-                        'EEPROM_MENU_ENABLE' ]
-        },
-
-    'ff_creator' :
-        { 'mcu' : 'atmega1280',
-          'programmer' : 'stk500v1',
-          'board_directory' : 'mighty_one',
-          'defines' : [ 'HEATERS_ON_STEROIDS', 'HAS_RGB_LED', 'COOLING_FAN_PWM',
-                        'PLATFORM_SPLASH1_MSG=\\\"SF-Creator\\\"',
-                        'PLATFORM_TOOLHEAD_OFFSET_X=3201',
-                        'PLATFORM_THE_REPLICATOR_STR=\\\"FF Creator\\\"',
-                        'EEPROM_MENU_ENABLE' ]
-        },
-
-    'ff_creator-2560-zmax' :
-        { 'mcu' : 'atmega2560', 
-          'programmer' : 'stk500v2',
-          'board_directory' : 'mighty_one',
-          'defines' : [ 'BUILD_STATS', 'ALTERNATE_UART', 'COOLING_FAN_PWM', 'USE_ZMAX_HOME',
-                        'PLATFORM_SPLASH1_MSG=\\\"SF-FF Creator\\\"',
-                        'PLATFORM_TOOLHEAD_OFFSET_X=3201',
-                        'PLATFORM_THE_REPLICATOR_STR=\\\"FF Creator\\\"',
-                        'HEATERS_ON_STEROIDS', 'AUTO_LEVEL','AUTO_LEVEL_IGNORE_ZMIN_ONBUILD',
-                        'PSTOP_ZMIN_LEVEL', 'HAS_RGB_LED', 'RGB_LED_MENU',
-                        'EEPROM_MENU_ENABLE' ]
-        },
-		
-    'ff_creator-2560' :
-        { 'mcu' : 'atmega2560', 
-          'programmer' : 'stk500v2',
-          'board_directory' : 'mighty_one',
-          'defines' : [ 'BUILD_STATS', 'ALTERNATE_UART', 'COOLING_FAN_PWM',
-                        'PLATFORM_SPLASH1_MSG=\\\"SF-FF Creator\\\"',
-                        'PLATFORM_TOOLHEAD_OFFSET_X=3201',
-                        'PLATFORM_THE_REPLICATOR_STR=\\\"FF Creator\\\"',
-                        'HEATERS_ON_STEROIDS', 'AUTO_LEVEL','AUTO_LEVEL_IGNORE_ZMIN_ONBUILD',
-                        'PSTOP_ZMIN_LEVEL', 'HAS_RGB_LED', 'RGB_LED_MENU',
-                        'EEPROM_MENU_ENABLE' ]
-        },
-
-	'ff_creatorx-2560-zmax' :
-        { 'mcu' : 'atmega2560',
-          'programmer' : 'stk500v2',
-          'board_directory' : 'mighty_one',
-          'defines' : [ 'BUILD_STATS', 'ALTERNATE_UART', 'HBP_SOFTPWM',
-                        'COOLING_FAN_PWM', 'USE_ZMAX_HOME',
-                        'PLATFORM_SPLASH1_MSG=\\\"SF-FF CreatorX\\\"',
-                        'PLATFORM_TOOLHEAD_OFFSET_X=3201',
-                        'PLATFORM_THE_REPLICATOR_STR=\\\"Creator X / Pro\\\"',
-                        'HEATERS_ON_STEROIDS', 'AUTO_LEVEL','AUTO_LEVEL_IGNORE_ZMIN_ONBUILD',
-                        'PSTOP_ZMIN_LEVEL', 'HAS_RGB_LED', 'RGB_LED_MENU',
-                        'EEPROM_MENU_ENABLE' ]
-        },
-		
-    'ff_creatorx-2560' :
-        { 'mcu' : 'atmega2560',
-          'programmer' : 'stk500v2',
-          'board_directory' : 'mighty_one',
-          'defines' : [ 'BUILD_STATS', 'ALTERNATE_UART', 'HBP_SOFTPWM',
-                        'COOLING_FAN_PWM',
-                        'PLATFORM_SPLASH1_MSG=\\\"SF-FF CreatorX\\\"',
-                        'PLATFORM_TOOLHEAD_OFFSET_X=3201',
-                        'PLATFORM_THE_REPLICATOR_STR=\\\"Creator X / Pro\\\"',
-                        'HEATERS_ON_STEROIDS', 'AUTO_LEVEL','AUTO_LEVEL_IGNORE_ZMIN_ONBUILD',
-                        'PSTOP_ZMIN_LEVEL', 'HAS_RGB_LED', 'RGB_LED_MENU',
-                        'EEPROM_MENU_ENABLE' ]
-        },
-
-    'wanhao_dup4-hyper-zmax' :
-        { 'mcu' : 'atmega1280',
-          'programmer' : 'stk500v1',
-          'board_directory' : 'mighty_one',
-          'defines' : [ 'AUTO_LEVEL', 'PSTOP_ZMIN_LEVEL', 'AUTO_LEVEL_IGNORE_ZMIN_ONBUILD', 'USE_ZMAX_HOME',
-                        'BUILD_STATS','HEATERS_ON_STEROIDS', 'COOLING_FAN_PWM', 'USE_ZMAX_HOME',
-                        'PLATFORM_SPLASH1_MSG=\\\"SF-Wanhao Dup4\\\"',
-                        'PLATFORM_THE_REPLICATOR_STR=\\\"Wanhao Duplicatr\\\"',
-                        'PLATFORM_TOOLHEAD_OFFSET_X=3201',
-                        'PLATFORM_X_OFFSET_STEPS=13763L',
-                        'PLATFORM_Y_OFFSET_STEPS=6919L',
-                        'HAS_RGB_LED', 'EEPROM_MENU_ENABLE' ]
-        },
-		
-    'wanhao_dup4-hyper' :
-        { 'mcu' : 'atmega1280',
-          'programmer' : 'stk500v1',
-          'board_directory' : 'mighty_one',
-          'defines' : [ 'AUTO_LEVEL', 'PSTOP_ZMIN_LEVEL', 'AUTO_LEVEL_IGNORE_ZMIN_ONBUILD',
-                        'BUILD_STATS','HEATERS_ON_STEROIDS', 'COOLING_FAN_PWM',
-                        'PLATFORM_SPLASH1_MSG=\\\"SF-Wanhao Dup4\\\"',
-                        'PLATFORM_THE_REPLICATOR_STR=\\\"Wanhao Duplicatr\\\"',
-                        'PLATFORM_TOOLHEAD_OFFSET_X=3201',
-                        'PLATFORM_X_OFFSET_STEPS=13763L',
-                        'PLATFORM_Y_OFFSET_STEPS=6919L',
-                        'HAS_RGB_LED', 'EEPROM_MENU_ENABLE' ]
-        },
-
-    'zyyx-1280-hyper' :
-        { 'mcu' : 'atmega1280',
-          'programmer' : 'stk500v1',
-          'board_directory' : 'mighty_one',
-          'defines' : [ 'AUTO_LEVEL', 'PSTOP_ZMIN_LEVEL', 'AUTO_LEVEL_IGNORE_ZMIN_ONBUILD',
-                        'BUILD_STATS','SINGLE_EXTRUDER', 'ZYYX_3D_PRINTER',
-                        'HEATERS_ON_STEROIDS', 'COOLING_FAN_PWM',
-                        'PLATFORM_SPLASH1_MSG=\\\"SF-ZYYX 3DP\\\"',
-                        'PLATFORM_THE_REPLICATOR_STR=\\\"ZYYX 3D Printer\\\"',
-                        'PLATFORM_X_OFFSET_STEPS=11957L',
-                        'PLATFORM_Y_OFFSET_STEPS=10186L',
-                        'PLATFORM_HBP_PRESENT=0',
-                        'PLATFORM_AXIS_LENGTHS={270L, 230L, 195L, 100000L, 100000L}',
-                        'PLATFORM_AXIS_STEPS_PER_MM={88573186, 88573186, 400000000, 96275202, 96275202}',
-                        'AUTO_LEVEL', 'AUTO_LEVEL_ZYYX', 'PSTOP_ZMIN_LEVEL' ]
-        },
-
-    'wanhao_dup4' :
-        { 'mcu' : 'atmega1280',
-          'programmer' : 'stk500v1',
-          'board_directory' : 'mighty_one',
-          'defines' : [ 'HEATERS_ON_STEROIDS', 'COOLING_FAN_PWM',
-                        'PLATFORM_SPLASH1_MSG=\\\"SF-Wanhao Dup4\\\"',
-                        'PLATFORM_THE_REPLICATOR_STR=\\\"Wanhao Duplicatr\\\"',
-                        'PLATFORM_TOOLHEAD_OFFSET_X=3201',
-                        'PLATFORM_X_OFFSET_STEPS=13763L',
-                        'PLATFORM_Y_OFFSET_STEPS=6919L',
-                        'HAS_RGB_LED', 'EEPROM_MENU_ENABLE' ]
-        },
-
-    'zyyx-1280' :
-        { 'mcu' : 'atmega1280',
-          'programmer' : 'stk500v1',
-          'board_directory' : 'mighty_one',
-          'defines' : [ 'SINGLE_EXTRUDER', 'ZYYX_3D_PRINTER',
-                        'HEATERS_ON_STEROIDS', 'COOLING_FAN_PWM',
-                        'PLATFORM_SPLASH1_MSG=\\\"SF-ZYYX 3DP\\\"',
-                        'PLATFORM_THE_REPLICATOR_STR=\\\"ZYYX 3D Printer\\\"',
-                        'PLATFORM_X_OFFSET_STEPS=11957L',
-                        'PLATFORM_Y_OFFSET_STEPS=10186L',
-                        'PLATFORM_HBP_PRESENT=0',
-                        'PLATFORM_AXIS_LENGTHS={270L, 230L, 195L, 100000L, 100000L}',
-                        'PLATFORM_AXIS_STEPS_PER_MM={88573186, 88573186, 400000000, 96275202, 96275202}',
-                        'AUTO_LEVEL', 'AUTO_LEVEL_ZYYX', 'PSTOP_ZMIN_LEVEL' ]
-        },
-
-    'zyyx-2560' :
-        { 'mcu' : 'atmega2560',
-          'programmer' : 'stk500v2',
-          'board_directory' : 'mighty_one',
-          'defines' : [ 'EEPROM_MENU_ENABLE', 'BUILD_STATS', 'SINGLE_EXTRUDER',
-                        'ALTERNATE_UART', 'ZYYX_3D_PRINTER', 'COOLING_FAN_PWM',
-                        'PLATFORM_SPLASH1_MSG=\\\"SF-ZYYX 3DP\\\"',
-                        'PLATFORM_THE_REPLICATOR_STR=\\\"ZYYX 3D Printer\\\"',
-                        'PLATFORM_X_OFFSET_STEPS=11957L',
-                        'PLATFORM_Y_OFFSET_STEPS=10186L',
-                        'PLATFORM_HBP_PRESENT=0',
-                        'PLATFORM_AXIS_LENGTHS={270L, 230L, 195L, 100000L, 100000L}',
-                        'PLATFORM_AXIS_STEPS_PER_MM={88573186, 88573186, 400000000, 96275202, 96275202}',
-                        'HEATERS_ON_STEROIDS', 'AUTO_LEVEL','AUTO_LEVEL_IGNORE_ZMIN_ONBUILD', 'AUTO_LEVEL_ZYYX',
-                        'PSTOP_ZMIN_LEVEL', 'ZYYX_LEVEL_SCRIPT' ]
-        },
-
-    'zyyx-dual-2560' :
-        { 'mcu' : 'atmega2560',
-          'programmer' : 'stk500v2',
-          'board_directory' : 'mighty_one',
-          'defines' : [ 'EEPROM_MENU_ENABLE', 'BUILD_STATS', 'COOLING_FAN_PWM',
-                        'ALTERNATE_UART', 'ZYYX_3D_PRINTER',
-                        'PLATFORM_SPLASH1_MSG=\\\"SF-ZYYX 3DP\\\"',
-                        'PLATFORM_THE_REPLICATOR_STR=\\\"ZYYX 3D Printer\\\"',
-                        'PLATFORM_X_OFFSET_STEPS=11957L',
-                        'PLATFORM_Y_OFFSET_STEPS=10186L',
-                        'PLATFORM_HBP_PRESENT=0',
-                        'PLATFORM_AXIS_LENGTHS={270L, 230L, 195L, 100000L, 100000L}',
-                        'PLATFORM_AXIS_STEPS_PER_MM={88573186, 88573186, 400000000, 96275202, 96275202}',
-                        'HEATERS_ON_STEROIDS', 'AUTO_LEVEL','AUTO_LEVEL_IGNORE_ZMIN_ONBUILD', 'AUTO_LEVEL_ZYYX',
-                        'PSTOP_ZMIN_LEVEL', 'ZYYX_LEVEL_SCRIPT' ]
-        },
-
-    'azteeg-x3-xymax' :
-        { 'mcu' : 'atmega2560',
-          'programmer' : 'stk500v2',
-          'board_directory' : 'azteeg_x3',
-          'defines' : [ 'BUILD_STATS', 'HEATERS_ON_STEROIDS',
-                        'PLATFORM_SPLASH1_MSG=\\\"SF-Azteeg XYmx\\\"',
-                        'PLATFORM_THE_REPLICATOR_STR=\\\"Azteeg X3\\\"',
-                        'PLATFORM_X_OFFSET_STEPS=14309L',
-                        'PLATFORM_Y_OFFSET_STEPS=7060L',
-                        'PLATFORM_VREF_DEFAULTS={127, 127, 127, 127, 127}',
-                        'AUTO_LEVEL', 'AUTO_LEVEL_IGNORE_ZMIN_ONBUILD','PSTOP_ZMIN_LEVEL', 'COOLING_FAN_PWM',
-                        'EEPROM_MENU_ENABLE', 'HAS_RGB_LED' ]
-        },
-
-    'azteeg-x3-xymax-corexy' :
-        { 'mcu' : 'atmega2560',
-          'programmer' : 'stk500v2',
-          'board_directory' : 'azteeg_x3',
-          'defines' : [ 'CORE_XY', 'BUILD_STATS', 'HEATERS_ON_STEROIDS',
-                        'PLATFORM_SPLASH1_MSG=\\\"SF-Azteeg XYmx\\\"',
-                        'PLATFORM_THE_REPLICATOR_STR=\\\"Azteeg X3 CoreXY\\\"',
-                        'PLATFORM_X_OFFSET_STEPS=14309L',
-                        'PLATFORM_Y_OFFSET_STEPS=7060L',
-                        'PLATFORM_VREF_DEFAULTS={127, 127, 127, 127, 127}',
-                        'AUTO_LEVEL', 'AUTO_LEVEL_IGNORE_ZMIN_ONBUILD','PSTOP_ZMIN_LEVEL', 'COOLING_FAN_PWM',
-                        'EEPROM_MENU_ENABLE', 'HAS_RGB_LED' ]
-        },
-
-    'azteeg-x3-xymin' :
-        { 'mcu' : 'atmega2560',
-          'programmer' : 'stk500v2',
-          'board_directory' : 'azteeg_x3',
-          'defines' : [ 'BUILD_STATS', 'HEATERS_ON_STEROIDS', 'XY_MIN_HOMING',
-                        'PLATFORM_SPLASH1_MSG=\\\"SF-Azteeg XYmn\\\"',
-                        'PLATFORM_THE_REPLICATOR_STR=\\\"Azteeg X3\\\"',
-                        'PLATFORM_X_OFFSET_STEPS=0L',
-                        'PLATFORM_Y_OFFSET_STEPS=0L',
-                        'PLATFORM_VREF_DEFAULTS={127, 127, 127, 127, 127}',
-                        'AUTO_LEVEL', 'AUTO_LEVEL_IGNORE_ZMIN_ONBUILD','PSTOP_ZMIN_LEVEL', 'COOLING_FAN_PWM',
-                        'EEPROM_MENU_ENABLE', 'HAS_RGB_LED' ]
-        },
-
-    'azteeg-x3-xymin-corexy' :
-        { 'mcu' : 'atmega2560',
-          'programmer' : 'stk500v2',
-          'board_directory' : 'azteeg_x3',
-          'defines' : [ 'CORE_XY', 'BUILD_STATS', 'HEATERS_ON_STEROIDS',
-                        'PLATFORM_SPLASH1_MSG=\\\"SF-Azteeg XYmn\\\"',
-                        'PLATFORM_THE_REPLICATOR_STR=\\\"Azteeg X3 CoreXY\\\"',
-                        'PLATFORM_X_OFFSET_STEPS=0L',
-                        'PLATFORM_Y_OFFSET_STEPS=0L',
-                        'PLATFORM_VREF_DEFAULTS={127, 127, 127, 127, 127}',
-                        'AUTO_LEVEL', 'AUTO_LEVEL_IGNORE_ZMIN_ONBUILD', 'PSTOP_ZMIN_LEVEL', 'COOLING_FAN_PWM',
-                        'EEPROM_MENU_ENABLE', 'HAS_RGB_LED',
-                        'XY_MIN_HOMING' ]
-        },
+from __future__ import print_function
+
+from collections import namedtuple
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
+__all__ = [ 'Platform', 'platforms', 'get_platform', 'get_platform_names',
+            'get_platforms', 'get_setting', 'defines_set', 'effective_defines',
+            'cppflags_for' ]
+
+# Files in the directory holding this file
+_TABLE_FILE = 'platforms.json'
+
+# Files in the user's home directory
+_SITE_JSON_FILE = '.sailfish_platforms.json'
+_SITE_FILE = '.sailfish_platforms.py'
+_CACHE_FILE = '.sailfish_platforms.cache'
+
+def _here(name):
+    import os.path
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), name)
+
+def _home(name):
+    import os.path
+    return os.path.join(os.path.expanduser('~'), name)
+
+def _cache_file():
+    # One cache file per Python version, as the marshal format differs
+    # between Python releases
+    import sys
+    return _home(_CACHE_FILE + '-py%d%d' % sys.version_info[:2])
+
+try:
+    _intern = intern
+except NameError:
+    from sys import intern as _intern
+
+# Tuples already seen by _native(), so that equal ones are shared
+_tuples = {}
+
+def _native(obj):
+    # json hands back unicode strings under Python 2; SCons wants str.
+    # Strings are interned so that the many defines repeated across
+    # platforms (splash messages, axis settings, ...) exist only once,
+    # and lists become tuples since the settings are never modified.
+    # Equal tuples, such as the axis settings shared by a family of
+    # printers, are likewise reduced to a single object.
+    if isinstance(obj, dict):
+        return dict((_native(k), _native(v)) for k, v in obj.items())
+    if isinstance(obj, (list, tuple)):
+        obj = tuple(_native(v) for v in obj)
+        try:
+            return _tuples.setdefault(obj, obj)
+        except TypeError:
+            return obj
+    if isinstance(obj, type(u'')) and not isinstance(obj, str):
+        # Python 2 only: str(obj) would fail for non-ASCII text
+        obj = obj.encode('utf-8')
+    if isinstance(obj, str):
+        return _intern(obj)
+    return obj
+
+def _load_user_overrides():
+    # Load data from ~/.sailfish_platforms.py and ~/.sailfish_platforms.json.
+    # Both files are read; a platform defined in both is taken from the
+    # JSON file.  None if there is neither.
+    platforms = None
+    try:
+        f = open(_home(_SITE_FILE))
+    except IOError:
+        pass
+    else:
+        with f:
+            source = f.read()
+        platforms = _literal_platforms(source)
+        if platforms is None:
+            tmp_dict = { 'platforms' : {} }
+            exec(source, tmp_dict)
+            platforms = tmp_dict.get('platforms')
+
+    import io
+    try:
+        f = io.open(_home(_SITE_JSON_FILE), encoding='utf-8')
+    except IOError:
+        pass
+    else:
+        import json
+        with f:
+            json_platforms = json.load(f)
+        if platforms:
+            platforms = dict(platforms)
+            platforms.update(json_platforms)
+        else:
+            platforms = json_platforms
+    return platforms
+
+def _literal_platforms(source):
+    # Most ~/.sailfish_platforms.py files consist only of statements like
+    #
+    #   platforms['name'] = { ... }
+    #
+    # with literal values.  Those are evaluated with ast.literal_eval
+    # rather than run.  None if the file holds anything else.
+    import ast
+    platforms = {}
+    try:
+        for stmt in ast.parse(source).body:
+            if not (isinstance(stmt, ast.Assign) and len(stmt.targets) == 1):
+                return None
+            target = stmt.targets[0]
+            if not (isinstance(target, ast.Subscript) and
+                    isinstance(target.value, ast.Name) and
+                    target.value.id == 'platforms'):
+                return None
+            key = target.slice
+            if isinstance(key, ast.Index):
+                key = key.value
+            platforms[ast.literal_eval(key)] = ast.literal_eval(stmt.value)
+    except (SyntaxError, ValueError):
+        return None
+    return platforms
+
+def _build_table():
+    import json
+    with open(_here(_TABLE_FILE)) as f:
+        table = _native(json.load(f))
+    platforms = table['platforms']
+
+    tmp_platforms = _load_user_overrides()
+    if tmp_platforms:
+        for key in tmp_platforms:
+            platforms[_native(key)] = _native(tmp_platforms[key])
+
+    names = tuple(sorted(platforms))
+    return table['templates'], platforms, names
+
+# Settings holding the values of a C array initializer: the setting, the
+# define it is emitted as and the suffix written after each value
+_ARRAY_SETTINGS = (
+    ('axis_lengths', 'PLATFORM_AXIS_LENGTHS', 'L'),
+    ('axis_steps_per_mm', 'PLATFORM_AXIS_STEPS_PER_MM', ''),
+    ('max_feedrates', 'PLATFORM_MAX_FEEDRATES', ''),
+    ('vref_defaults', 'PLATFORM_VREF_DEFAULTS', ''),
+)
+
+# A platform's resolved build settings.  Settings a platform does not give
+# take the value from _DEFAULTS.
+Platform = namedtuple('Platform', ('mcu', 'programmer', 'board_directory',
+                                   'defines', 'squeeze') +
+                                  tuple(s[0] for s in _ARRAY_SETTINGS))
+
+_DEFAULTS = {
+    'mcu' : 'atmega1280',
+    'programmer' : 'stk500v1',
+    'board_directory' : 'mighty_one',
+    'defines' : (),
+    'squeeze' : (),
 }
 
-# Load data from ~/.sailfish_platforms.py
-
-tmp_dict = { 'platforms' : {} }
-home = expanduser('~')
-if home[-1] != '/':
-    home += '/'
-site_file = home + '.sailfish_platforms.py'
-
-if isfile(site_file):
-    with open(site_file) as f:
-        exec(f.read(), tmp_dict)
-
-    if 'platforms' in tmp_dict:
-        tmp_platforms = tmp_dict['platforms']
-        for key in tmp_platforms:
-            platforms[key] = tmp_platforms[key]
+def _format_c_array(name, values, suffix=''):
+    return '%s={%s}' % (name, ', '.join('%d%s' % (v, suffix) for v in values))
+
+def _resolve(entry, templates):
+    # Merge a platform entry with the template(s) named by its 'base' and
+    # turn its array settings into defines.  Those defines follow the
+    # template defines but precede the entry's own, so that the entry can
+    # still override or remove them.
+    base = entry.get('base', ())
+    if not isinstance(base, tuple):
+        base = (base,)
+    platform = { 'defines' : () }
+    for settings in [templates[name] for name in base] + [entry]:
+        for key in settings:
+            if key == 'defines':
+                if settings is not entry:
+                    platform['defines'] += settings['defines']
+            elif key != 'base':
+                platform[key] = settings[key]
+    for key, define, suffix in _ARRAY_SETTINGS:
+        if key in platform:
+            platform['defines'] += \
+                (_intern(_format_c_array(define, platform[key], suffix)),)
+    platform['defines'] += entry.get('defines', ())
+    return Platform(*[platform.get(field, _DEFAULTS.get(field))
+                      for field in Platform._fields])
+
+def _cache_key():
+    # The path, mtime and size of this file, the table and the site files,
+    # with None for the mtime and size of a missing file.  The paths matter
+    # since several checkouts share the one cache file.
+    import os
+    key = []
+    for path in (_here('platforms.py'), _here(_TABLE_FILE),
+                 _home(_SITE_JSON_FILE), _home(_SITE_FILE)):
+        path = os.path.abspath(path)
+        try:
+            st = os.stat(path)
+            # st_mtime_ns is Python 3 only; the float st_mtime may not
+            # tell apart two writes within the same second
+            key.append((path, getattr(st, 'st_mtime_ns', st.st_mtime),
+                        st.st_size))
+        except OSError:
+            key.append((path, None, None))
+    return tuple(key)
+
+def _read_cache_entries():
+    # The cache file holds a dictionary mapping the directory of each
+    # checkout to its (key, table), so that switching between checkouts
+    # does not throw away the other's cache
+    import marshal
+    try:
+        # Reading the whole file first is much faster than having
+        # marshal.load() read it piecemeal under Python 3
+        with open(_cache_file(), 'rb') as f:
+            entries = marshal.loads(f.read())
+    except Exception:
+        return {}
+    if not isinstance(entries, dict):
+        return {}
+    return entries
+
+def _read_cache(key):
+    try:
+        cached_key, table = _read_cache_entries()[_here('')]
+    except Exception:
+        return None
+    if cached_key != key:
+        return None
+    return table
+
+def _write_cache(key, table):
+    # The cache is written to a temporary file which is then renamed over
+    # the old one, so another build never reads a partially written cache
+    import marshal
+    import os
+    import tempfile
+    entries = _read_cache_entries()
+    for directory in [d for d in entries if not os.path.isdir(d)]:
+        del entries[directory]
+    entries[_here('')] = (key, table)
+    path = _cache_file()
+    try:
+        fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(path) + '.',
+                                        dir=os.path.dirname(path))
+    except Exception:
+        return
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            marshal.dump(entries, f, marshal.version)
+        try:
+            os.rename(tmp_path, path)
+        except OSError:
+            # Windows will not rename over an existing file
+            os.remove(path)
+            os.rename(tmp_path, path)
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+_table = None
+
+def _load_table():
+    # (templates, platforms, sorted platform names) as read from
+    # platforms.json and the site file
+    global _table
+    if _table is None:
+        key = _cache_key()
+        _table = _read_cache(key)
+        if _table is None:
+            _table = _build_table()
+            _write_cache(key, _table)
+    return _table
+
+def get_platform_names():
+    """Return the sorted names of all known platforms without resolving
+    their build settings."""
+    return _load_table()[2]
+
+def _memoize(func):
+    # Remember func's result per argument for the rest of the process
+    # (functools.lru_cache is not available under Python 2)
+    results = {}
+    def wrapper(name):
+        if name not in results:
+            results[name] = func(name)
+        return results[name]
+    wrapper.__name__ = func.__name__
+    wrapper.__doc__ = func.__doc__
+    return wrapper
+
+@_memoize
+def get_platform(name):
+    """Return the build settings for the platform named name, merged with
+    the template it is based on, as a Platform."""
+    templates, platforms, names = _load_table()
+    return _resolve(platforms[name], templates)
+
+@_memoize
+def defines_set(name):
+    """Return the defines of the platform named name as a frozenset, for
+    fast membership tests."""
+    return frozenset(get_platform(name).defines)
+
+@_memoize
+def effective_defines(name):
+    """Return the defines of the platform named name with its '-' removals
+    applied.  A removal that does not match an earlier define of the
+    platform is kept, so that the caller can still apply it to its own
+    list of #defines."""
+    defines = []
+    for d in get_platform(name).defines:
+        if d.startswith('-') and d[1:] in defines:
+            defines.remove(d[1:])
+        else:
+            defines.append(d)
+    return tuple(defines)
+
+@_memoize
+def cppflags_for(name):
+    """Return the -D compiler flags establishing the platform's effective
+    defines.  Removals left over by effective_defines() are not included;
+    they are for the caller to apply to its own flags."""
+    return tuple('-D' + d for d in effective_defines(name)
+                 if not d.startswith('-'))
+
+@_memoize
+def _setting(field):
+    return dict((name, getattr(get_platform(name), field))
+                for name in get_platform_names())
+
+def get_setting(field):
+    """Return a dictionary mapping each platform name to the value of one
+    Platform field, e.g. get_setting('mcu'), for queries that look at a
+    single setting of every platform.  Each call returns a new dictionary,
+    which the caller is free to modify."""
+    return dict(_setting(field))
+
+class _PlatformTable(Mapping):
+    # Read-only mapping of platform names to Platforms.  Unlike a dict
+    # built up front, it only resolves the platforms that are looked up.
+
+    def __getitem__(self, name):
+        return get_platform(name)
+
+    def __iter__(self):
+        return iter(get_platform_names())
+
+    def __len__(self):
+        return len(get_platform_names())
+
+    def __contains__(self, name):
+        return name in _load_table()[1]
+
+platforms = _PlatformTable()
+
+def get_platforms():
+    """Return the mapping of known platforms, including any entries
+    supplied by ~/.sailfish_platforms.json or ~/.sailfish_platforms.py.
+    The table is read once per process and cached on disk between runs;
+    each platform is resolved when it is first looked up."""
+    return platforms
+
+def main():
+    """Print the names of all known platforms, separated by spaces."""
+    print(' '.join(get_platform_names()))
 
 if __name__ == '__main__':
-    list = ''
-    for key in platforms:
-        list += key + ' '
-    print list[:-1]
+    main()